@@ -13,33 +13,34 @@ This tool allows users to:
 import os
 import sys
 import shutil
-import argparse
 import subprocess
 import logging
-import traceback
-from pathlib import Path
-from datetime import datetime
-import errno
 import stat
+import time
 
 # Define the projects root directory
 PROJECTS_DIR = os.path.expanduser("~/Documents/Projects")
+# Prefix for joining names read from PROJECTS_DIR itself, which need no normalization
+_PROJECTS_PREFIX = PROJECTS_DIR + os.sep
 
 # Setup logging
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
-os.makedirs(LOG_DIR, exist_ok=True)
-LOG_FILE = os.path.join(LOG_DIR, f'scaffold_{datetime.now().strftime("%Y%m%d")}.log')
+LOG_FILE = os.path.join(LOG_DIR, f'scaffold_{time.strftime("%Y%m%d")}.log')
+
+# Cache for the template virtual environment
+CACHE_DIR = os.path.join(os.path.dirname(LOG_DIR), 'cache')
+TEMPLATE_VENV = os.path.join(CACHE_DIR, f'venv-{sys.version_info.major}.{sys.version_info.minor}')
+
+# Packages installed into the template (and so into every new) virtual environment
+TEMPLATE_PACKAGES = []
 
 # Configure logger
 logger = logging.getLogger('scaffold')
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.INFO)  # Raised to DEBUG in verbose mode
 
-# File handler
-file_handler = logging.FileHandler(LOG_FILE)
-file_handler.setLevel(logging.DEBUG)
+# File handler, attached by _install_file_handler()
+file_handler = None
 file_format = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(file_format)
-logger.addHandler(file_handler)
 
 # Console handler
 console_handler = logging.StreamHandler()
@@ -51,19 +52,107 @@ logger.addHandler(console_handler)
 # Global debug flag
 DEBUG = False
 
+# Number of threads used to probe project subdirectories for a venv
+FIND_VENV_WORKERS = 8
+
+class _LogFileHandler(logging.FileHandler):
+    """FileHandler that creates LOG_DIR and opens the log file on first write."""
+    
+    def __init__(self, filename):
+        super().__init__(filename, delay=True)
+    
+    def _open(self):
+        os.makedirs(LOG_DIR, exist_ok=True)
+        return super()._open()
+
 
-def validate_project_name(name):
+def _install_file_handler(level):
     """
-    Validate that a project name is available.
+    Attach the log file handler, or lower its level if already attached.
+    
+    Nothing touches the disk until a record at or above the level is logged.
     
     Args:
-        name (str): Name of the project to validate
+        level (int): Minimum level of records written to LOG_FILE
+    """
+    global file_handler
+    if file_handler is None:
+        file_handler = _LogFileHandler(LOG_FILE)
+        file_handler.setLevel(level)
+        file_handler.setFormatter(file_format)
+        logger.addHandler(file_handler)
+    else:
+        file_handler.setLevel(min(file_handler.level, level))
+
+
+def _excepthook(exc_type, exc, tb):
+    """
+    Log uncaught exceptions, with their traceback, to the console and log file.
+    
+    Installed as sys.excepthook when run as a script; KeyboardInterrupt keeps
+    the interpreter's default handling.
+    """
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc, tb)
+        return
+    _install_file_handler(logging.ERROR)
+    logger.error(f"An error occurred: {str(exc)}", exc_info=(exc_type, exc, tb))
+
+
+# In-process directory listings, keyed by path: {path: (mtime_ns, entries)}
+_dir_cache = {}
+
+# Coarsest common mtime resolution (HFS+); newer listings aren't cached because a
+# change within the same tick would leave the mtime unchanged
+_MTIME_RESOLUTION_NS = 1_000_000_000
+
+
+class CachedDir:
+    """
+    Directory listings memoized on the directory's modification time.
+    
+    Listings are kept in memory for the life of the process only; persisting
+    them costs more (reading the cache file and importing json) than the
+    single scandir a hit saves. Directories modified within the last second
+    are always re-read.
+    """
+    
+    @classmethod
+    def entries(cls, path):
+        """
+        List a directory, reusing the cached listing if it hasn't changed.
+        
+        Args:
+            path (str): Path to the directory to list
+            
+        Returns:
+            list: (name, is_dir) tuples for each entry in the directory
+        """
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = _dir_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        # DirEntry.is_dir() is answered from the dirent type; only symlinks need a stat
+        with os.scandir(path) as it:
+            entries = [(entry.name, entry.is_dir()) for entry in it]
+        if time.time_ns() - mtime_ns >= _MTIME_RESOLUTION_NS:
+            _dir_cache[path] = (mtime_ns, entries)
+        return entries
+
+
+def has_venv(project_path):
+    """
+    Check whether a project folder has a virtual environment in its root.
+    
+    Args:
+        project_path (str): Path to the project folder
         
     Returns:
-        bool: True if the project name is available, False otherwise
+        bool: True if project_path/venv is a virtual environment, False otherwise
     """
-    project_path = os.path.join(PROJECTS_DIR, name)
-    return not os.path.exists(project_path)
+    # pyvenv.cfg marks the root of every venv
+    return os.path.lexists(os.path.join(project_path, "venv", "pyvenv.cfg"))
 
 
 def find_venv(project_path):
@@ -80,19 +169,31 @@ def find_venv(project_path):
     venv_path = os.path.join(project_path, "venv")
     activate_script = os.path.join(venv_path, "bin", "activate")
     
-    if os.path.exists(activate_script):
+    if has_venv(project_path) or os.path.exists(activate_script):
         return activate_script
     
     # Check for venv in subdirectories (1 level deep only for performance)
-    for item in os.listdir(project_path):
-        subdir_path = os.path.join(project_path, item)
-        if os.path.isdir(subdir_path):
-            subdir_venv = os.path.join(subdir_path, "venv")
-            subdir_activate = os.path.join(subdir_venv, "bin", "activate")
-            if os.path.exists(subdir_activate):
-                return subdir_activate
-    
-    return None
+    try:
+        with os.scandir(project_path) as it:
+            candidates = [os.path.join(entry.path, "venv", "bin", "activate")
+                          for entry in it if entry.is_dir()]
+    except OSError:
+        # e.g. a project slot occupied by a broken symlink
+        return None
+    
+    # A serial loop beats thread start-up for a handful of local stats
+    if len(candidates) <= FIND_VENV_WORKERS:
+        return next((path for path in candidates if os.path.exists(path)), None)
+    
+    # Probe subdirectories concurrently (stat releases the GIL), but take the
+    # first match in listing order so the result is the same on every run
+    from concurrent.futures import ThreadPoolExecutor
+    executor = ThreadPoolExecutor(max_workers=FIND_VENV_WORKERS)
+    try:
+        found = executor.map(os.path.exists, candidates)
+        return next((path for path, exists in zip(candidates, found) if exists), None)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def create_project(name, env=False):
@@ -106,22 +207,27 @@ def create_project(name, env=False):
     Returns:
         bool: True if the project was created successfully, False otherwise
     """
-    if not validate_project_name(name):
-        logger.error(f"Project '{name}' already exists.")
-        print(f"Error: Project '{name}' already exists.")
-        print(f"You can either:")
-        print(f"  1. cd into it: cd ~/Documents/Projects/{name}")
-        print(f"  2. Choose another project name")
-        return False
-    
     try:
+        # Only commands that write need the projects directory to exist
+        if not os.path.isdir(PROJECTS_DIR):
+            os.makedirs(PROJECTS_DIR, exist_ok=True)
+        
         project_path = os.path.join(PROJECTS_DIR, name)
-        os.makedirs(project_path, exist_ok=True)
+        # mkdir reports an existing project atomically, no separate exists() check
+        try:
+            os.mkdir(project_path)
+        except FileExistsError:
+            logger.error(f"Project '{name}' already exists.")
+            print(f"Error: Project '{name}' already exists.")
+            print(f"You can either:")
+            print(f"  1. cd into it: cd ~/Documents/Projects/{name}")
+            print(f"  2. Choose another project name")
+            return False
         logger.info(f"Created project folder: {project_path}")
         print(f"Created project folder: {project_path}")
         
         if env:
-            create_venv(project_path)
+            create_venvs([project_path])
         
         return True
     except Exception as e:
@@ -130,39 +236,333 @@ def create_project(name, env=False):
         return False
 
 
-def create_venv(project_path):
+def run_command(args):
+    """
+    Run a command and wait for it, like subprocess.run(args, check=True).
+    
+    Uses os.posix_spawn where available to avoid fork() duplicating this
+    process's address space; falls back to subprocess elsewhere (e.g. Windows).
+    
+    Args:
+        args (list): Command to run; args[0] must be an absolute path
+        
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero status
+    """
+    if not hasattr(os, "posix_spawn"):
+        subprocess.run(args, check=True)
+        return
+    
+    pid = os.posix_spawn(args[0], args, os.environ)
+    _, status = os.waitpid(pid, 0)
+    returncode = os.waitstatus_to_exitcode(status)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, args)
+
+
+def build_venv(venv_path):
+    """
+    Build a Python 3.12 virtual environment from scratch with `python -m venv`.
+    
+    Args:
+        venv_path (str): Path where the virtual environment should be created
+        
+    Raises:
+        subprocess.CalledProcessError: If venv creation or pip bootstrapping fails
+    """
+    # Skip pip during venv creation and bootstrap it into this venv only, so
+    # parallel creations don't contend for shared pip state. The prompt is
+    # fixed so venvs cloned from the template don't inherit its directory name.
+    run_command([sys.executable, "-m", "venv", 
+                 "--without-pip",
+                 "--prompt", "venv",
+                 venv_path])
+    run_command([os.path.join(venv_path, "bin", "python"),
+                 "-m", "ensurepip", "--default-pip"])
+
+
+def template_venv_matches():
+    """
+    Check whether the template virtual environment was built by this interpreter.
+    
+    Besides the Python version, the interpreter location recorded in pyvenv.cfg
+    must match, so a template built by another installation of the same
+    version (e.g. pyenv vs Homebrew), or by one that has since moved, isn't
+    cloned with a `home` pointing at the wrong interpreter.
+    
+    Returns:
+        bool: True if TEMPLATE_VENV can be cloned, False otherwise
+    """
+    try:
+        with open(os.path.join(TEMPLATE_VENV, "pyvenv.cfg")) as f:
+            config = {key.strip(): value.strip()
+                      for key, _, value in (line.partition("=") for line in f)}
+    except OSError:
+        return False
+    version = config.get("version") or config.get("version_info", "")
+    if version.split(".")[:2] != [str(n) for n in sys.version_info[:2]]:
+        return False
+    
+    # The interpreter `python -m venv` records; inside a venv that's its base
+    base_executable = os.path.abspath(getattr(sys, "_base_executable", sys.executable))
+    if config.get("home") != os.path.dirname(base_executable):
+        return False
+    # Only written by Python 3.11+
+    executable = config.get("executable")
+    return executable is None or executable == os.path.realpath(base_executable)
+
+
+def ensure_template_venv():
+    """
+    Create the template virtual environment on first use.
+    
+    The template is built under a temporary name and moved into place, behind
+    a lock file, so concurrent runs never see or delete a half-built template.
+    
+    Returns:
+        str or None: Path to the template virtual environment, or None if it
+        could not be created
+        
+    Raises:
+        subprocess.CalledProcessError: If building the venv itself fails; the
+        same command would fail for the project venvs too. A failed install
+        of TEMPLATE_PACKAGES returns None instead.
+    """
+    if template_venv_matches():
+        return TEMPLATE_VENV
+    
+    try:
+        import fcntl
+    except ImportError:
+        # No flock (Windows); building under a temporary name still keeps
+        # the published template intact
+        fcntl = None
+    
+    build_dir = f"{TEMPLATE_VENV}.build-{os.getpid()}"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(TEMPLATE_VENV + ".lock", "w") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            # Another run may have built the template while we waited
+            if template_venv_matches():
+                return TEMPLATE_VENV
+            
+            logger.info(f"Creating template virtual environment at {TEMPLATE_VENV}...")
+            build_venv(build_dir)
+            if TEMPLATE_PACKAGES:
+                try:
+                    run_command([os.path.join(build_dir, "bin", "python"),
+                                 "-m", "pip", "install", *TEMPLATE_PACKAGES])
+                except subprocess.CalledProcessError as e:
+                    # e.g. no network; plain per-project venvs can still be built
+                    logger.warning(f"Could not install template packages: {str(e)}")
+                    return None
+            
+            # Point the venv at its final location, then publish it in one step
+            relocate_venv(build_dir, build_dir, TEMPLATE_VENV)
+            shutil.rmtree(TEMPLATE_VENV, ignore_errors=True)
+            os.replace(build_dir, TEMPLATE_VENV)
+        return TEMPLATE_VENV
+    except OSError as e:
+        logger.warning(f"Could not create template virtual environment: {str(e)}")
+        return None
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+
+def relocate_venv(venv_path, old_path, new_path):
+    """
+    Rewrite the absolute path a virtual environment was created at.
+    
+    pyvenv.cfg, the activate scripts and console-script shebangs embed it.
+    
+    Args:
+        venv_path (str): Path to the virtual environment to rewrite
+        old_path (str): Path the virtual environment was created at
+        new_path (str): Path the virtual environment should refer to
+    """
+    bin_dir = os.path.join(venv_path, "bin")
+    with os.scandir(bin_dir) as it:
+        paths = [entry.path for entry in it if entry.is_file(follow_symlinks=False)]
+    paths.append(os.path.join(venv_path, "pyvenv.cfg"))
+    
+    old, new = os.fsencode(old_path), os.fsencode(new_path)
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        if old in data:
+            with open(path, "wb") as f:
+                f.write(data.replace(old, new))
+
+
+def clone_venv(template, venv_path):
+    """
+    Copy a template virtual environment and point it at its new location.
+    
+    Args:
+        template (str): Path to the template virtual environment
+        venv_path (str): Path where the virtual environment should be created
+    """
+    shutil.copytree(template, venv_path, symlinks=True, ignore_dangling_symlinks=True)
+    relocate_venv(venv_path, template, venv_path)
+
+
+def create_venv(project_path, template=None):
     """
     Create a Python 3.12 virtual environment in the project folder.
     
     Args:
         project_path (str): Path to the project folder
+        template (str or None): Template virtual environment to clone, or None
+            to build the virtual environment from scratch
         
     Returns:
         bool: True if the virtual environment was created successfully, False otherwise
     """
+    venv_dir = os.path.join(project_path, "venv")
+    activate_bin = os.path.join(venv_dir, "bin", "activate")
+    activate_sh = os.path.join(project_path, "activate.sh")
+    
     try:
         logger.info("Creating Python 3.12 virtual environment...")
         print("Creating Python 3.12 virtual environment...")
-        subprocess.run([sys.executable, "-m", "venv", 
-                        "--python=python3.12", 
-                        os.path.join(project_path, "venv")], 
-                        check=True)
+        if template:
+            try:
+                clone_venv(template, venv_dir)
+            except OSError as e:
+                logger.warning(f"Could not copy template virtual environment: {str(e)}")
+                shutil.rmtree(venv_dir, ignore_errors=True)
+                template = None
+        if not template:
+            build_venv(venv_dir)
         
-        # Create a script to activate the virtual environment
-        with open(os.path.join(project_path, "activate.sh"), "w") as f:
-            f.write(f"#!/bin/bash\nsource {os.path.join(project_path, 'venv/bin/activate')}\n")
-        os.chmod(os.path.join(project_path, "activate.sh"), 0o755)
+        # Create a script to activate the virtual environment, executable from
+        # the start and published atomically
+        script = f"#!/bin/bash\nsource {activate_bin}\n".encode()
+        tmp_script = activate_sh + ".tmp"
+        fd = os.open(tmp_script, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            os.write(fd, script)
+        finally:
+            os.close(fd)
+        os.replace(tmp_script, activate_sh)
         
-        logger.info(f"Virtual environment created at {os.path.join(project_path, 'venv')}")
-        print(f"Virtual environment created at {os.path.join(project_path, 'venv')}")
-        print(f"You can activate it with: source {os.path.join(project_path, 'activate.sh')}")
+        logger.info(f"Virtual environment created at {venv_dir}")
+        print(f"Virtual environment created at {venv_dir}")
+        print(f"You can activate it with: source {activate_sh}")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
+        # Each project reports its own failure instead of aborting the batch
         logger.error(f"Error creating virtual environment: {str(e)}")
         print(f"Error creating virtual environment: {str(e)}")
         return False
 
 
+def create_venvs(project_paths):
+    """
+    Create virtual environments in project folders, in parallel when there are several.
+    
+    Args:
+        project_paths (list): Paths to the project folders
+        
+    Returns:
+        list: True or False for each project folder, as returned by create_venv
+    """
+    if not project_paths:
+        return []
+    
+    # Resolve the template once here; workers only clone it (or build from
+    # scratch if it's unavailable) and never retry building it
+    try:
+        template = ensure_template_venv()
+    except subprocess.CalledProcessError as e:
+        # The same venv command would fail for every project, so don't rerun it
+        logger.error(f"Error creating virtual environment: {str(e)}")
+        print(f"Error creating virtual environment: {str(e)}")
+        return [False] * len(project_paths)
+    
+    if len(project_paths) == 1:
+        return [create_venv(project_paths[0], template)]
+    
+    # Imported here so list/navigate don't pay for multiprocessing on startup
+    from concurrent.futures import ProcessPoolExecutor
+    max_workers = min(len(project_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(create_venv, project_paths,
+                                 [template] * len(project_paths)))
+
+
+def _raise(error):
+    """os.walk onerror callback that propagates the error instead of skipping it."""
+    raise error
+
+
+def make_tree_writable(path):
+    """
+    Give the owner full access to every entry in a directory tree.
+    
+    Symlinks are skipped so that nothing outside the tree is changed.
+    
+    Args:
+        path (str): Path to the directory tree
+    """
+    chmod, mode = os.chmod, stat.S_IRWXU
+    pending = [path]
+    while pending:
+        dir_path = pending.pop()
+        # Make the directory readable before listing it
+        chmod(dir_path, mode)
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif not entry.is_symlink():
+                    chmod(entry.path, mode)
+
+
+def _unlink_tree(path):
+    """Remove a directory tree bottom-up with direct unlink/rmdir calls."""
+    join, unlink, rmdir = os.path.join, os.unlink, os.rmdir
+    for root, dirs, files in os.walk(path, topdown=False, onerror=_raise):
+        for name in files:
+            unlink(join(root, name))
+        for name in dirs:
+            entry_path = join(root, name)
+            try:
+                rmdir(entry_path)
+            except NotADirectoryError:
+                # Symlink to a directory; os.walk doesn't descend into it
+                unlink(entry_path)
+    rmdir(path)
+
+
+def remove_tree(path):
+    """
+    Remove a directory tree.
+    
+    If an entry can't be removed because of its permissions, the remaining
+    tree is made writable in a single pass and removal is retried.
+    
+    Args:
+        path (str): Path to the directory tree to remove
+        
+    Raises:
+        OSError: If an entry can't be removed
+    """
+    # Never delete through a symlinked project, only the link itself
+    if os.path.islink(path):
+        os.unlink(path)
+        return
+    
+    try:
+        _unlink_tree(path)
+    except PermissionError as e:
+        logger.warning(f"Error removing {e.filename}: {e.strerror}; making the project writable and retrying")
+        make_tree_writable(path)
+        _unlink_tree(path)
+
+
 def delete_project(name):
     """
     Delete a project folder after confirmation.
@@ -173,18 +573,20 @@ def delete_project(name):
     Returns:
         bool: True if the project was deleted successfully, False otherwise
     """
-    logger.debug(f"Attempting to delete project: {name}")
+    logger.debug("Attempting to delete project: %s", name)
     project_path = os.path.join(PROJECTS_DIR, name)
     
     # Log detailed info about the project directory
-    logger.debug(f"Project path to delete: {project_path}")
-    if os.path.exists(project_path):
-        logger.debug(f"Project exists, checking contents...")
-        try:
-            contents = os.listdir(project_path)
-            logger.debug(f"Directory contents: {contents}")
-        except Exception as e:
-            logger.error(f"Error listing directory contents: {str(e)}")
+    logger.debug("Project path to delete: %s", project_path)
+    if os.path.lexists(project_path):
+        # Only list the directory when the listing will actually be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Project exists, checking contents...")
+            try:
+                contents = os.listdir(project_path)
+                logger.debug("Directory contents: %s", contents)
+            except Exception as e:
+                logger.error(f"Error listing directory contents: {str(e)}")
     else:
         logger.error(f"Project '{name}' does not exist at path: {project_path}")
         print(f"Error: Project '{name}' does not exist.")
@@ -192,32 +594,21 @@ def delete_project(name):
     
     # Ask for confirmation
     logger.debug("Asking for user confirmation...")
-    confirm = input(f"Are you sure you want to delete the project '{name}'? This cannot be undone. (y/N): ")
+    confirm = input(f"Are you sure you want to delete the project '{name}'? This cannot be undone. (y/N): ").strip().lower()
     
-    if confirm.lower() not in ["y", "yes"]:
+    if confirm not in ("y", "yes"):
         logger.info("Delete operation cancelled.")
         print("Delete operation cancelled.")
         return False
     
     try:
-        logger.debug(f"Attempting to remove directory tree: {project_path}")
-        # Use additional error handling for the rmtree operation
-        def handle_remove_readonly(func, path, exc):
-            excvalue = exc[1]
-            logger.warning(f"Error removing {path}: {excvalue}")
-            if func in (os.rmdir, os.remove, os.unlink) and excvalue.errno == errno.EACCES:
-                os.chmod(path, stat.S_IRWXU| stat.S_IRWXG| stat.S_IRWXO)
-                func(path)
-            else:
-                raise
-        
-        shutil.rmtree(project_path, onerror=handle_remove_readonly)
+        logger.debug("Attempting to remove directory tree: %s", project_path)
+        remove_tree(project_path)
         logger.info(f"Project '{name}' has been deleted.")
         print(f"Project '{name}' has been deleted.")
         return True
     except Exception as e:
-        logger.error(f"Error deleting project: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error deleting project: {str(e)}")
         print(f"Error deleting project: {str(e)}")
         return False
 
@@ -234,6 +625,9 @@ def navigate_project(name):
     """
     # Special case for 'home' - navigate to the projects directory root
     if name.lower() == 'home':
+        # The projects directory is only created on demand, so it may not exist yet
+        if not os.path.isdir(PROJECTS_DIR):
+            os.makedirs(PROJECTS_DIR, exist_ok=True)
         logger.info(f"Navigating to projects root directory: {PROJECTS_DIR}")
         logger.info(f"NAVIGATE_TO:{PROJECTS_DIR}")
         print(f"NAVIGATE_TO:{PROJECTS_DIR}")
@@ -242,7 +636,7 @@ def navigate_project(name):
     project_path = os.path.join(PROJECTS_DIR, name)
     
     # If the project exists, check for virtual environment and return path for navigation
-    if os.path.exists(project_path):
+    if os.path.lexists(project_path):
         venv_path = find_venv(project_path)
         if venv_path:
             logger.info(f"NAVIGATE_TO:{project_path}")
@@ -255,20 +649,19 @@ def navigate_project(name):
         return 0
     
     # If the project doesn't exist, ask if we should create it
-    create = input(f"Project '{name}' does not exist. Would you like to create it? (y/N): ")
+    create = input(f"Project '{name}' does not exist. Would you like to create it? (y/N): ").strip().lower()
     
-    if create.lower() not in ["y", "yes"]:
+    if create not in ("y", "yes"):
         logger.info("Operation cancelled.")
         print("Operation cancelled.")
         return 2
     
     # Ask if a virtual environment should be created
-    env = input("Would you like to create a Python 3.12 virtual environment in the project? (y/N): ")
-    env_flag = env.lower() in ["y", "yes"]
+    env = input("Would you like to create a Python 3.12 virtual environment in the project? (y/N): ").strip().lower()
+    env_flag = env in ("y", "yes")
     
     # Create the project
     if create_project(name, env_flag):
-        project_path = os.path.join(PROJECTS_DIR, name)
         if env_flag:
             venv_path = os.path.join(project_path, "venv", "bin", "activate")
             logger.info(f"NAVIGATE_TO:{project_path}")
@@ -283,12 +676,47 @@ def navigate_project(name):
     return 2
 
 
+def list_projects():
+    """
+    Print all projects, marking those with a virtual environment in their root.
+    """
+    try:
+        projects = sorted(d for d, is_dir in CachedDir.entries(PROJECTS_DIR)
+                          if is_dir and not d.startswith('.'))
+    except FileNotFoundError:
+        projects = []
+    if projects:
+        logger.info("Available projects:")
+        print("Available projects:")
+        for project in projects:
+            venv_indicator = " (has venv)" if has_venv(_PROJECTS_PREFIX + project) else ""
+            logger.info(f"  - {project}{venv_indicator}")
+            print(f"  - {project}{venv_indicator}")
+    else:
+        logger.info("No projects found.")
+        print("No projects found.")
+
+
 def main():
     """
     Main function to handle command line arguments and execute the appropriate action.
     """
     global DEBUG
     
+    # Fast path for plain `list` and `navigate NAME`, which take no options
+    # and so don't need argparse
+    argv = sys.argv[1:]
+    if argv == ['list'] or (len(argv) == 2 and argv[0] == 'navigate'
+                            and not argv[1].startswith('-')):
+        _install_file_handler(logging.ERROR)
+        if argv[0] == 'list':
+            list_projects()
+            return
+        sys.exit(navigate_project(argv[1]))
+    
+    # Imported here so the fast path above never pays for it
+    import argparse
+    
     # Create the main parser
     parser = argparse.ArgumentParser(
         description="Scaffold CLI - Manage project folders in ~/Documents/Projects")
@@ -303,10 +731,10 @@ def main():
     # Create project command
     create_parser = subparsers.add_parser('create', 
         help='Create a new project folder and automatically navigate to it',
-        description='Create a new project folder with the given name and automatically navigate to it. Optionally create a Python 3.12 virtual environment.',
+        description='Create a new project folder with the given name and automatically navigate to it. Several names create several projects at once. Optionally create a Python 3.12 virtual environment in each.',
         prog='go create')
-    create_parser.add_argument('name', help='Name of the project to create')
-    create_parser.add_argument('--env', action='store_true', help='Create a Python 3.12 virtual environment')
+    create_parser.add_argument('name', nargs='+', help='Name of the project to create (several names create several projects)')
+    create_parser.add_argument('--env', action='store_true', help='Create a Python 3.12 virtual environment in each project')
     
     # Delete project command
     delete_parser = subparsers.add_parser('delete', help='Delete a project folder')
@@ -325,6 +753,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Only errors reach the log file unless verbose mode is enabled
+    _install_file_handler(logging.DEBUG if args.verbose else logging.ERROR)
+    
     # If no arguments provided, print help
     if len(sys.argv) == 1:
         parser.print_help()
@@ -333,31 +764,19 @@ def main():
     # Set global debug flag and configure logging level
     if hasattr(args, 'verbose') and args.verbose:
         DEBUG = True
+        logger.setLevel(logging.DEBUG)
         console_handler.setLevel(logging.DEBUG)
         logger.debug("Verbose mode enabled")
     
-    # Ensure the projects directory exists
-    os.makedirs(PROJECTS_DIR, exist_ok=True)
-    
     if args.command == 'create':
-        create_project(args.name, args.env)
+        created = [os.path.join(PROJECTS_DIR, name) for name in args.name
+                   if create_project(name)]
+        if args.env:
+            create_venvs(created)
     elif args.command == 'delete':
         delete_project(args.name)
     elif args.command == 'list':
-        projects = [d for d in os.listdir(PROJECTS_DIR) 
-                   if os.path.isdir(os.path.join(PROJECTS_DIR, d)) and not d.startswith('.')]
-        if projects:
-            logger.info("Available projects:")
-            print("Available projects:")
-            for project in sorted(projects):
-                project_path = os.path.join(PROJECTS_DIR, project)
-                venv_path = find_venv(project_path)
-                venv_indicator = " (has venv)" if venv_path else ""
-                logger.info(f"  - {project}{venv_indicator}")
-                print(f"  - {project}{venv_indicator}")
-        else:
-            logger.info("No projects found.")
-            print("No projects found.")
+        list_projects()
     elif args.command == 'navigate':
         sys.exit(navigate_project(args.name))
     else:
@@ -365,8 +784,5 @@ def main():
 
 
 if __name__ == "__main__":
-    try:
-        main()
-    except Exception as e:
-        logger.error(f"An error occurred: {str(e)}")
-        logger.error(traceback.format_exc())
+    sys.excepthook = _excepthook
+    main()